@@ -1,8 +1,17 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from collections import deque
+import heapq
 import math
 
+# Event kinds for the event-driven engine. Events that share a timestamp are
+# handled in this order, so arrivals join the ready queue ahead of a process
+# whose time quantum expires at the same instant.
+ARRIVAL = 0
+IO_DONE = 1
+SLICE_END = 2
+SWITCH_DONE = 3
+
 class SchedulerApp:
     def __init__(self, root):
         self.root = root
@@ -23,6 +32,16 @@ class SchedulerApp:
             "Round Robin"
         ]
 
+        # Ready-queue policy and preemption used by the event-driven engine
+        self.event_policies = {
+            "First-Come, First-Served (FCFS)": ("fcfs", False),
+            "Non-Preemptive Shortest Job First (SJF)": ("sjf", False),
+            "Preemptive Shortest Job First (SJF)": ("sjf", True),
+            "Non-Preemptive Priority Scheduling": ("priority", False),
+            "Preemptive Priority Scheduling": ("priority", True),
+            "Round Robin": ("rr", False)
+        }
+
         # Top Frame for Algorithm Selection and Number of Processes
         top_frame = tk.Frame(root)
         top_frame.pack(pady=10)
@@ -36,8 +55,13 @@ class SchedulerApp:
         self.num_entry = tk.Entry(top_frame, textvariable=self.num_processes)
         self.num_entry.grid(row=1, column=1, padx=5, pady=5, sticky='w')
 
+        tk.Label(top_frame, text="Context Switch Time:").grid(row=2, column=0, padx=5, pady=5, sticky='w')
+        self.context_switch_entry = tk.Entry(top_frame)
+        self.context_switch_entry.insert(0, "0")
+        self.context_switch_entry.grid(row=2, column=1, padx=5, pady=5, sticky='w')
+
         self.enter_button = tk.Button(top_frame, text="Enter Processes", command=self.enter_processes)
-        self.enter_button.grid(row=2, column=0, columnspan=2, pady=10)
+        self.enter_button.grid(row=3, column=0, columnspan=2, pady=10)
 
         # Frame for Process Entries
         self.process_frame = tk.Frame(root)
@@ -94,7 +118,7 @@ class SchedulerApp:
             return
 
         # Define headers
-        headers = ["Process ID", "Arrival Time", "Burst Time"]
+        headers = ["Process ID", "Arrival Time", "Bursts (CPU,I/O,CPU...)"]
         if hasattr(self, 'priority_required') and self.priority_required:
             headers.append("Priority")
         if hasattr(self, 'time_quantum_required') and self.time_quantum_required:
@@ -109,7 +133,7 @@ class SchedulerApp:
             tk.Label(self.process_frame, text=process_id).grid(row=i+1, column=0, padx=5, pady=5)
             arrival_entry = tk.Entry(self.process_frame, width=10)
             arrival_entry.grid(row=i+1, column=1, padx=5, pady=5)
-            burst_entry = tk.Entry(self.process_frame, width=10)
+            burst_entry = tk.Entry(self.process_frame, width=20)
             burst_entry.grid(row=i+1, column=2, padx=5, pady=5)
             if hasattr(self, 'priority_required') and self.priority_required:
                 priority_entry = tk.Entry(self.process_frame, width=10)
@@ -138,12 +162,24 @@ class SchedulerApp:
             messagebox.showerror("Selection Error", "Please select a scheduling algorithm.")
             return
 
+        try:
+            context_switch = int(self.context_switch_entry.get() or 0)
+            if context_switch < 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Input Error", "Please enter a non-negative integer for the Context Switch Time.")
+            return
+
         try:
             processes = []
             for entry in self.process_entries:
                 pid = entry["id"]
                 arrival = int(entry["arrival"].get())
-                burst = int(entry["burst"].get())
+                # Bursts alternate CPU and I/O and must start and end with a CPU burst
+                bursts = [int(b) for b in entry["burst"].get().split(",")]
+                if len(bursts) % 2 == 0 or any(b <= 0 for b in bursts[0::2]) or any(b < 0 for b in bursts[1::2]):
+                    messagebox.showerror("Input Error", f"Bursts of {pid} must alternate CPU,I/O,...,CPU with positive CPU and non-negative I/O times.")
+                    return
                 if self.priority_required:
                     priority = int(entry["priority"].get())
                 else:
@@ -155,13 +191,31 @@ class SchedulerApp:
                 processes.append({
                     "pid": pid,
                     "arrival": arrival,
-                    "burst": burst,
+                    "burst": sum(bursts[0::2]),
+                    "bursts": bursts,
                     "priority": priority,
                     "time_quantum": time_quantum
                 })
 
+            if algorithm not in self.event_policies:
+                messagebox.showerror("Algorithm Error", "Selected algorithm is not supported.")
+                return
+
+            if algorithm == "Round Robin":
+                if any(p["time_quantum"] is None for p in processes):
+                    # If time quantum not entered per process, take a single time quantum
+                    time_quantum = self.prompt_time_quantum()
+                    if time_quantum is None:
+                        return
+                    for p in processes:
+                        p["time_quantum"] = time_quantum
+
+            # Workloads with I/O bursts or a switching cost go through the event-driven engine
+            if context_switch > 0 or any(len(p["bursts"]) > 1 for p in processes):
+                policy, preemptive = self.event_policies[algorithm]
+                result = self.event_driven_scheduling(processes, policy, preemptive, context_switch)
             # Depending on the algorithm, call the appropriate scheduling function
-            if algorithm == "First-Come, First-Served (FCFS)":
+            elif algorithm == "First-Come, First-Served (FCFS)":
                 result = self.fcfs_scheduling(processes)
             elif algorithm == "Non-Preemptive Shortest Job First (SJF)":
                 result = self.non_preemptive_sjf(processes)
@@ -171,24 +225,17 @@ class SchedulerApp:
                 result = self.non_preemptive_priority(processes)
             elif algorithm == "Preemptive Priority Scheduling":
                 result = self.preemptive_priority(processes)
-            elif algorithm == "Round Robin":
-                if any(p["time_quantum"] is None for p in processes):
-                    # If time quantum not entered per process, take a single time quantum
-                    time_quantum = self.prompt_time_quantum()
-                    if time_quantum is None:
-                        return
-                    for p in processes:
-                        p["time_quantum"] = time_quantum
-                result = self.round_robin_scheduling(processes)
             else:
-                messagebox.showerror("Algorithm Error", "Selected algorithm is not supported.")
-                return
+                result = self.round_robin_scheduling(processes)
 
             # Display results
             self.display_results(result)
 
             # Draw Gantt chart
-            self.draw_gantt_chart(result["gantt_chart"])
+            if "gantt_segments" in result:
+                self.draw_gantt_segments(result["gantt_segments"])
+            else:
+                self.draw_gantt_chart(result["gantt_chart"])
 
         except ValueError:
             messagebox.showerror("Input Error", "Please enter valid integer values for all fields.")
@@ -227,6 +274,8 @@ class SchedulerApp:
         headers = ["Process", "Arrival", "Burst"]
         if "Priority" in result:
             headers.append("Priority")
+        if "IO" in result:
+            headers.append("I/O Time")
         headers += ["Waiting Time", "Turnaround Time", "Response Time"]
 
         header_line = "".join(f"{h:<15}" for h in headers)
@@ -237,6 +286,8 @@ class SchedulerApp:
             line = f"{p['pid']:<15}{p['arrival']:<15}{p['burst']:<15}"
             if "Priority" in result:
                 line += f"{p['priority']:<15}"
+            if "IO" in result:
+                line += f"{p['io_time']:<15}"
             line += f"{p['waiting_time']:<15}{p['turnaround_time']:<15}{p['response_time']:<15}\n"
             self.result_text.insert(tk.END, line)
 
@@ -245,6 +296,11 @@ class SchedulerApp:
         self.result_text.insert(tk.END, f"Average Waiting Time: {result['avg_waiting_time']:.2f}\n")
         self.result_text.insert(tk.END, f"Average Turnaround Time: {result['avg_turnaround_time']:.2f}\n")
         self.result_text.insert(tk.END, f"Average Response Time: {result['avg_response_time']:.2f}\n")
+        if "cpu_utilization" in result:
+            self.result_text.insert(tk.END, f"CPU Utilization: {result['cpu_utilization'] * 100:.2f}%\n")
+            self.result_text.insert(tk.END, f"Throughput: {result['throughput']:.4f} processes/unit time\n")
+            self.result_text.insert(tk.END, f"Context Switches: {result['context_switches']} ({result['context_switch_time']} time units)\n")
+            self.result_text.insert(tk.END, f"I/O Overlap: {result['io_overlap'] * 100:.2f}% of I/O time ran alongside the CPU\n")
 
         self.result_text.config(state='disabled')
 
@@ -281,12 +337,43 @@ class SchedulerApp:
             self.canvas.create_line(x, 100, x, 110, fill="black")
             self.canvas.create_text(x, 120, text=str(t), fill="black")
 
+    def draw_gantt_segments(self, segments):
+        """
+        Draw a Gantt chart given as (label, start, end) segments.
+        """
+        self.canvas.delete("all")
+        if not segments:
+            return
+
+        # Calculate total time
+        total_time = segments[-1][2]
+        if total_time == 0:
+            return
+
+        # Define canvas dimensions
+        canvas_width = 800
+        unit_width = (canvas_width - 100) / total_time  # Leave some margin
+
+        # Draw Gantt chart blocks, labelling the timeline at segment boundaries
+        self.canvas.create_text(50, 120, text="0", fill="black")
+        for label, start, end in segments:
+            x0 = 50 + start * unit_width
+            x1 = 50 + end * unit_width
+            self.canvas.create_rectangle(x0, 50, x1, 100, fill=self.get_color(label), outline="black")
+            self.canvas.create_text((x0 + x1) / 2, 75, text=label, fill="black")
+            self.canvas.create_line(x1, 100, x1, 110, fill="black")
+            self.canvas.create_text(x1, 120, text=str(end), fill="black")
+
+        # Draw timeline
+        self.canvas.create_line(50, 100, canvas_width - 50, 100, fill="black")
+
     def get_color(self, pid):
         """
         Generate a unique color for each process based on its ID.
         """
         colors = {
             "Idle": "lightgrey",
+            "CS": "darkgrey",
             "P1": "lightblue",
             "P2": "lightgreen",
             "P3": "lightpink",
@@ -648,6 +735,206 @@ class SchedulerApp:
             "avg_response_time": avg_response
         }
 
+    def event_driven_scheduling(self, processes, policy, preemptive=False, context_switch=0):
+        """
+        Event-Driven Scheduling for processes with alternating CPU and I/O bursts.
+        Each process's 'bursts' list is [CPU, I/O, CPU, ..., CPU]. Time jumps from one
+        event (arrival, I/O completion, context switch done, burst end or quantum expiry)
+        to the next through a priority queue, so the cost grows with the number of events
+        rather than the length of the schedule.
+        policy is "fcfs", "sjf", "priority" or "rr"; preemptive applies to "sjf" and "priority".
+        Every dispatch of a process other than the one that last ran costs context_switch
+        time units. A switch in progress is never interrupted; when it finishes, preemptive
+        policies load whichever ready process is best at that moment.
+        Lower numerical value means higher priority.
+        """
+        n = len(processes)
+        time_quantum = processes[0]['time_quantum'] if policy == "rr" else None  # Assuming same time quantum for all
+        if time_quantum is not None and time_quantum <= 0:
+            raise ValueError("Time quantum must be positive")
+        phase = [0] * n
+        remaining_burst = [p['bursts'][0] for p in processes]
+        ready_since = [0] * n
+        waiting_time = [0] * n
+        first_response = [None] * n
+        gantt_segments = []
+
+        events = []
+        seq = 0
+        for i, p in enumerate(processes):
+            heapq.heappush(events, (p['arrival'], ARRIVAL, seq, i, 0))
+            seq += 1
+
+        # FCFS and Round Robin serve in arrival order, the others by (key, arrival, index) from a heap
+        ready_queue = deque() if policy in ("fcfs", "rr") else []
+        running = None
+        is_switching = False
+        slice_start = 0
+        switch_start = 0
+        token = 0
+        last_run = None
+        cpu_busy = 0
+        context_switches = 0
+        io_active = 0
+        io_busy = 0
+        io_overlap = 0
+        last_time = 0
+        completed = 0
+
+        def key(i):
+            if policy == "sjf":
+                return remaining_burst[i]
+            return processes[i]['priority']
+
+        def add_segment(label, start, end):
+            prev_end = gantt_segments[-1][2] if gantt_segments else 0
+            if prev_end < start:
+                gantt_segments.append(("Idle", prev_end, start))
+            # Context switches stay separate so the chart shows each one
+            if label != "CS" and gantt_segments and gantt_segments[-1][0] == label and gantt_segments[-1][2] == start:
+                gantt_segments[-1] = (label, gantt_segments[-1][1], end)
+            elif end > start:
+                gantt_segments.append((label, start, end))
+
+        def make_ready(i, now):
+            ready_since[i] = now
+            if policy in ("fcfs", "rr"):
+                ready_queue.append(i)
+            else:
+                heapq.heappush(ready_queue, (key(i), processes[i]['arrival'], i))
+
+        def start_slice(i, now):
+            nonlocal running, is_switching, slice_start, token, last_run, seq
+            running = i
+            is_switching = False
+            slice_start = now
+            last_run = i
+            token += 1
+            exec_time = remaining_burst[i]
+            if time_quantum is not None:
+                exec_time = min(time_quantum, exec_time)
+            heapq.heappush(events, (now + exec_time, SLICE_END, seq, i, token))
+            seq += 1
+
+        def stop_slice(i, now):
+            nonlocal running, cpu_busy, token
+            ran = now - slice_start
+            if ran > 0 and first_response[i] is None:
+                first_response[i] = slice_start
+            remaining_burst[i] -= ran
+            cpu_busy += ran
+            add_segment(processes[i]['pid'], slice_start, now)
+            running = None
+            token += 1  # Invalidate any pending slice end for this dispatch
+
+        while events:
+            now = events[0][0]
+
+            # Account for the interval since the previous event
+            elapsed = now - last_time
+            if io_active > 0:
+                io_busy += elapsed
+                if running is not None and not is_switching:
+                    io_overlap += elapsed
+            last_time = now
+
+            # Handle every event at this instant before making a scheduling decision
+            while events and events[0][0] == now:
+                _, kind, _, i, event_token = heapq.heappop(events)
+                if kind == ARRIVAL:
+                    make_ready(i, now)
+                elif kind == IO_DONE:
+                    io_active -= 1
+                    make_ready(i, now)
+                elif kind == SWITCH_DONE:
+                    if preemptive and ready_queue and ready_queue[0][0] < key(i):
+                        # A better process became ready during the switch, so load it instead
+                        j = heapq.heappop(ready_queue)[2]
+                        waiting_time[j] += max(0, switch_start - ready_since[j])
+                        make_ready(i, switch_start)
+                        i = j
+                    start_slice(i, now)
+                elif event_token == token:
+                    stop_slice(i, now)
+                    if remaining_burst[i] > 0:
+                        # Quantum expired
+                        make_ready(i, now)
+                        continue
+                    bursts = processes[i]['bursts']
+                    phase[i] += 1
+                    if phase[i] == len(bursts):
+                        processes[i]['completion_time'] = now
+                        completed += 1
+                        continue
+                    io_time = bursts[phase[i]]
+                    phase[i] += 1
+                    remaining_burst[i] = bursts[phase[i]]
+                    io_active += 1
+                    heapq.heappush(events, (now + io_time, IO_DONE, seq, i, 0))
+                    seq += 1
+
+            # Preempt the running process if a better one is ready
+            if preemptive and running is not None and not is_switching and ready_queue:
+                running_key = key(running)
+                if policy == "sjf":
+                    running_key -= now - slice_start
+                if ready_queue[0][0] < running_key:
+                    i = running
+                    stop_slice(i, now)
+                    make_ready(i, now)
+
+            # Dispatch the next ready process onto an idle CPU
+            if running is None and ready_queue:
+                if policy in ("fcfs", "rr"):
+                    i = ready_queue.popleft()
+                else:
+                    i = heapq.heappop(ready_queue)[2]
+                waiting_time[i] += now - ready_since[i]
+                if context_switch > 0 and i != last_run:
+                    running = i
+                    is_switching = True
+                    switch_start = now
+                    context_switches += 1
+                    add_segment("CS", now, now + context_switch)
+                    heapq.heappush(events, (now + context_switch, SWITCH_DONE, seq, i, 0))
+                    seq += 1
+                else:
+                    start_slice(i, now)
+
+        for i, p in enumerate(processes):
+            p['io_time'] = sum(p['bursts'][1::2])
+            p['turnaround_time'] = p['completion_time'] - p['arrival']
+            p['waiting_time'] = waiting_time[i]
+            p['response_time'] = first_response[i] - p['arrival']
+
+        # Utilization and throughput are measured from the first arrival to the last completion
+        span = max(p['completion_time'] for p in processes) - min(p['arrival'] for p in processes)
+
+        # Calculate averages
+        total_waiting = sum(p['waiting_time'] for p in processes)
+        total_turnaround = sum(p['turnaround_time'] for p in processes)
+        total_response = sum(p['response_time'] for p in processes)
+        avg_waiting = total_waiting / n
+        avg_turnaround = total_turnaround / n
+        avg_response = total_response / n
+
+        result = {
+            "processes": processes,
+            "gantt_segments": gantt_segments,
+            "IO": True,
+            "avg_waiting_time": avg_waiting,
+            "avg_turnaround_time": avg_turnaround,
+            "avg_response_time": avg_response,
+            "cpu_utilization": cpu_busy / span if span else 0,
+            "throughput": n / span if span else 0,
+            "context_switches": context_switches,
+            "context_switch_time": context_switches * context_switch,
+            "io_overlap": io_overlap / io_busy if io_busy else 0
+        }
+        if policy == "priority":
+            result["Priority"] = True
+        return result
+
 def main():
     root = tk.Tk()
     app = SchedulerApp(root)